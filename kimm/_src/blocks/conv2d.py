@@ -1,10 +1,10 @@
 import typing
 
-from keras import backend
 from keras import layers
 from keras.src.utils.argument_validation import standardize_tuple
 
 from kimm._src.kimm_export import kimm_export
+from kimm._src.utils.data_format import get_channels_axis
 
 
 @kimm_export(parent_path=["kimm.blocks"])
@@ -29,7 +29,7 @@ def apply_conv2d_block(
         )
     kernel_size = standardize_tuple(kernel_size, 2, "kernel_size")
 
-    channels_axis = -1 if backend.image_data_format() == "channels_last" else -3
+    channels_axis = get_channels_axis()
     input_filters = inputs.shape[channels_axis]
     if has_skip and (strides != 1 or input_filters != filters):
         raise ValueError(
@@ -38,16 +38,7 @@ def apply_conv2d_block(
             f"Received: strides={strides}, filters={filters}, "
             f"input_filters={input_filters}"
         )
-    x = inputs
-
-    if padding is None:
-        padding = "same"
-        if strides > 1:
-            padding = "valid"
-            x = layers.ZeroPadding2D(
-                ((kernel_size[0] - 1) // 2, (kernel_size[1] - 1) // 2),
-                name=f"{name}_pad",
-            )(x)
+    x, padding = _apply_padding(inputs, kernel_size, strides, padding, name)
 
     if not use_depthwise:
         x = layers.Conv2D(
@@ -67,14 +58,46 @@ def apply_conv2d_block(
             use_bias=False,
             name=f"{name}_dwconv2d",
         )(x)
+    x = _apply_bn_activation(x, activation, bn_momentum, bn_epsilon, name)
+    if has_skip:
+        x = layers.Add()([x, inputs])
+    return x
+
+
+def _apply_padding(
+    inputs,
+    kernel_size: typing.Sequence[int],
+    strides: int,
+    padding: typing.Optional[typing.Literal["same", "valid"]],
+    name: str,
+):
+    """Resolve `padding` and apply explicit ZeroPadding for strided convs."""
+    x = inputs
+    if padding is None:
+        padding = "same"
+        if strides > 1:
+            padding = "valid"
+            x = layers.ZeroPadding2D(
+                ((kernel_size[0] - 1) // 2, (kernel_size[1] - 1) // 2),
+                name=f"{name}_pad",
+            )(x)
+    return x, padding
+
+
+def _apply_bn_activation(
+    inputs,
+    activation: typing.Optional[str],
+    bn_momentum: float,
+    bn_epsilon: float,
+    name: str,
+):
+    """BN + (Activation) on the channels axis."""
     x = layers.BatchNormalization(
-        axis=channels_axis,
+        axis=get_channels_axis(),
         name=f"{name}_bn",
         momentum=bn_momentum,
         epsilon=bn_epsilon,
-    )(x)
+    )(inputs)
     if activation is not None:
         x = layers.Activation(activation, name=name)(x)
-    if has_skip:
-        x = layers.Add()([x, inputs])
     return x
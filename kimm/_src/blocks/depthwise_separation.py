@@ -1,11 +1,15 @@
 import typing
 
-from keras import backend
 from keras import layers
+from keras import ops
+from keras.src.utils.argument_validation import standardize_tuple
 
+from kimm._src.blocks.conv2d import _apply_bn_activation
+from kimm._src.blocks.conv2d import _apply_padding
 from kimm._src.blocks.conv2d import apply_conv2d_block
 from kimm._src.blocks.squeeze_and_excitation import apply_se_block
 from kimm._src.kimm_export import kimm_export
+from kimm._src.utils.data_format import get_channels_axis
 
 
 @kimm_export(parent_path=["kimm.blocks"])
@@ -24,10 +28,19 @@ def apply_depthwise_separation_block(
     has_skip: bool = True,
     bn_epsilon: float = 1e-5,
     padding: typing.Optional[typing.Literal["same", "valid"]] = None,
+    fuse_dw_pw: bool = False,
     name: str = "depthwise_separation_block",
 ):
-    """Conv2D block + (SqueezeAndExcitation) + Conv2D."""
-    channels_axis = -1 if backend.image_data_format() == "channels_last" else -3
+    """Conv2D block + (SqueezeAndExcitation) + Conv2D.
+
+    If `fuse_dw_pw=True`, the depthwise and pointwise convolutions are merged
+    into a single `SeparableConv2D` followed by BN + (Activation), so the
+    backend can run them as one kernel without materializing the depthwise
+    output. This requires `se_ratio=0`, `activation=None` and
+    `pointwise_kernel_size=1` because nothing can sit between the two
+    convolutions.
+    """
+    channels_axis = get_channels_axis()
     input_filters = inputs.shape[channels_axis]
     if has_skip and (strides != 1 or input_filters != filters):
         raise ValueError(
@@ -36,8 +49,32 @@ def apply_depthwise_separation_block(
             f"Received: strides={strides}, filters={filters}, "
             f"input_filters={input_filters}"
         )
+    if fuse_dw_pw and (
+        se_ratio > 0 or activation is not None or pointwise_kernel_size != 1
+    ):
+        raise ValueError(
+            "If `fuse_dw_pw=True`, `se_ratio` must be 0, `activation` must be "
+            "None and `pointwise_kernel_size` must be 1. "
+            f"Received: se_ratio={se_ratio}, activation={activation}, "
+            f"pointwise_kernel_size={pointwise_kernel_size}"
+        )
 
     x = inputs
+    if fuse_dw_pw:
+        x = _apply_separable_conv2d_block(
+            x,
+            filters,
+            depthwise_kernel_size,
+            strides,
+            activation=pw_activation,
+            bn_epsilon=bn_epsilon,
+            padding=padding,
+            name=f"{name}_conv_dwpw",
+        )
+        if has_skip:
+            x = ops.add(x, inputs)
+        return x
+
     x = apply_conv2d_block(
         x,
         kernel_size=depthwise_kernel_size,
@@ -68,5 +105,31 @@ def apply_depthwise_separation_block(
         name=f"{name}_conv_pw",
     )
     if has_skip:
-        x = layers.Add()([x, inputs])
+        x = ops.add(x, inputs)
+    return x
+
+
+def _apply_separable_conv2d_block(
+    inputs,
+    filters: int,
+    kernel_size: int,
+    strides: int = 1,
+    activation: typing.Optional[str] = None,
+    bn_momentum: float = 0.9,
+    bn_epsilon: float = 1e-5,
+    padding: typing.Optional[typing.Literal["same", "valid"]] = None,
+    name: str = "separable_conv2d_block",
+):
+    """(ZeroPadding) + SeparableConv2D + BN + (Activation)."""
+    kernel_size = standardize_tuple(kernel_size, 2, "kernel_size")
+    x, padding = _apply_padding(inputs, kernel_size, strides, padding, name)
+    x = layers.SeparableConv2D(
+        filters,
+        kernel_size,
+        strides,
+        padding=padding,
+        use_bias=False,
+        name=f"{name}_sepconv2d",
+    )(x)
+    x = _apply_bn_activation(x, activation, bn_momentum, bn_epsilon, name)
     return x
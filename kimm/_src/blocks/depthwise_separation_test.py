@@ -0,0 +1,100 @@
+import numpy as np
+from absl.testing import parameterized
+from keras import layers
+from keras import models
+from keras import ops
+from keras.src import testing
+
+from kimm._src.blocks.depthwise_separation import (
+    apply_depthwise_separation_block,
+)
+
+
+class DepthwiseSeparationBlockTest(testing.TestCase, parameterized.TestCase):
+    @parameterized.named_parameters(
+        ("unfused_s1", False, 1),
+        ("unfused_s2", False, 2),
+        ("fused_s1", True, 1),
+        ("fused_s2", True, 2),
+    )
+    def test_output_shape(self, fuse_dw_pw, strides):
+        kwargs = {"activation": None} if fuse_dw_pw else {}
+        inputs = layers.Input(shape=(8, 8, 4))
+        outputs = apply_depthwise_separation_block(
+            inputs,
+            name="block",
+            filters=16,
+            strides=strides,
+            has_skip=False,
+            fuse_dw_pw=fuse_dw_pw,
+            **kwargs,
+        )
+        model = models.Model(inputs, outputs)
+        size = 8 // strides
+        self.assertEqual(model.output_shape, (None, size, size, 16))
+        layer_names = [layer.name for layer in model.layers]
+        if fuse_dw_pw:
+            self.assertIn("block_conv_dwpw_sepconv2d", layer_names)
+            self.assertEqual("block_conv_dwpw_pad" in layer_names, strides > 1)
+        else:
+            self.assertIn("block_conv_dw_dwconv2d", layer_names)
+            self.assertIn("block_conv_pw_conv2d", layer_names)
+
+    @parameterized.named_parameters(
+        ("unfused", False, "block_conv_pw_bn"),
+        ("fused", True, "block_conv_dwpw_bn"),
+    )
+    def test_skip(self, fuse_dw_pw, bn_name):
+        kwargs = {"activation": None} if fuse_dw_pw else {}
+        inputs = layers.Input(shape=(8, 8, 4))
+        outputs = apply_depthwise_separation_block(
+            inputs,
+            name="block",
+            filters=4,
+            has_skip=True,
+            fuse_dw_pw=fuse_dw_pw,
+            **kwargs,
+        )
+        model = models.Model(inputs, outputs)
+        # Zero out the residual branch so that only the skip remains
+        bn = model.get_layer(bn_name)
+        bn.gamma.assign(ops.zeros_like(bn.gamma))
+        bn.beta.assign(ops.zeros_like(bn.beta))
+        x = np.random.uniform(size=(2, 8, 8, 4)).astype("float32")
+
+        y = model(x, training=False)
+
+        self.assertAllClose(y, x)
+
+    @parameterized.named_parameters(
+        ("se_ratio", {"se_ratio": 0.25, "activation": None}),
+        ("activation", {"activation": "relu"}),
+        (
+            "pointwise_kernel_size",
+            {"activation": None, "pointwise_kernel_size": 3},
+        ),
+    )
+    def test_fused_invalid_args(self, kwargs):
+        with self.assertRaisesRegex(ValueError, "fuse_dw_pw=True"):
+            apply_depthwise_separation_block(
+                layers.Input(shape=(8, 8, 4)),
+                name="block",
+                filters=4,
+                has_skip=False,
+                fuse_dw_pw=True,
+                **kwargs,
+            )
+
+    @parameterized.named_parameters(("unfused", False), ("fused", True))
+    def test_invalid_skip(self, fuse_dw_pw):
+        kwargs = {"activation": None} if fuse_dw_pw else {}
+        with self.assertRaisesRegex(ValueError, "has_skip=True"):
+            apply_depthwise_separation_block(
+                layers.Input(shape=(8, 8, 4)),
+                name="block",
+                filters=4,
+                strides=2,
+                has_skip=True,
+                fuse_dw_pw=fuse_dw_pw,
+                **kwargs,
+            )
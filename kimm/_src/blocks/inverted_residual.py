@@ -1,11 +1,11 @@
 import typing
 
-from keras import backend
-from keras import layers
+from keras import ops
 
 from kimm._src.blocks.conv2d import apply_conv2d_block
 from kimm._src.blocks.squeeze_and_excitation import apply_se_block
 from kimm._src.kimm_export import kimm_export
+from kimm._src.utils.data_format import get_channels_axis
 from kimm._src.utils.make_divisble import make_divisible
 
 
@@ -26,26 +26,35 @@ def apply_inverted_residual_block(
     se_make_divisible_number: typing.Optional[int] = None,
     bn_epsilon: float = 1e-5,
     padding: typing.Optional[typing.Literal["same", "valid"]] = None,
+    skip_unit_expansion: bool = False,
     name: str = "inverted_residual_block",
 ):
-    """Conv2D block + DepthwiseConv2D block + (SE) + Conv2D."""
-    channels_axis = -1 if backend.image_data_format() == "channels_last" else -3
+    """Conv2D block + DepthwiseConv2D block + (SE) + Conv2D.
+
+    If `skip_unit_expansion=True` and the expansion doesn't change the number
+    of channels (e.g. `expansion_ratio=1.0`), the point-wise expansion is
+    skipped, as in the reference MobileNetV2 implementation. Note that this
+    removes the `{name}_conv_pw` weights and is therefore incompatible with
+    checkpoints trained with the expansion.
+    """
+    channels_axis = get_channels_axis()
     input_channels = inputs.shape[channels_axis]
     hidden_channels = make_divisible(input_channels * expansion_ratio)
     has_skip = strides == 1 and input_channels == filters
 
     x = inputs
     # Point-wise expansion
-    x = apply_conv2d_block(
-        x,
-        hidden_channels,
-        expansion_kernel_size,
-        1,
-        activation=activation,
-        bn_epsilon=bn_epsilon,
-        padding=padding,
-        name=f"{name}_conv_pw",
-    )
+    if not skip_unit_expansion or hidden_channels != input_channels:
+        x = apply_conv2d_block(
+            x,
+            hidden_channels,
+            expansion_kernel_size,
+            1,
+            activation=activation,
+            bn_epsilon=bn_epsilon,
+            padding=padding,
+            name=f"{name}_conv_pw",
+        )
     # Depth-wise convolution
     x = apply_conv2d_block(
         x,
@@ -80,5 +89,5 @@ def apply_inverted_residual_block(
         name=f"{name}_conv_pwl",
     )
     if has_skip:
-        x = layers.Add()([x, inputs])
+        x = ops.add(x, inputs)
     return x
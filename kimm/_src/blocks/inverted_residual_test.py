@@ -0,0 +1,53 @@
+from absl.testing import parameterized
+from keras import layers
+from keras import models
+from keras.src import testing
+
+from kimm._src.blocks.inverted_residual import apply_inverted_residual_block
+
+
+def _weight_paths(model):
+    return [weight.path for weight in model.weights]
+
+
+class InvertedResidualBlockTest(testing.TestCase, parameterized.TestCase):
+    @parameterized.named_parameters(
+        ("skip_unit_expansion", True, False), ("default", False, True)
+    )
+    def test_skip_unit_expansion(self, skip_unit_expansion, has_expansion):
+        # hidden_channels == input_channels with expansion_ratio=1.0
+        inputs = layers.Input(shape=(8, 8, 16))
+        outputs = apply_inverted_residual_block(
+            inputs,
+            name="block",
+            filters=16,
+            expansion_ratio=1.0,
+            skip_unit_expansion=skip_unit_expansion,
+        )
+        model = models.Model(inputs, outputs)
+        layer_names = [layer.name for layer in model.layers]
+        weight_paths = _weight_paths(model)
+
+        self.assertEqual("block_conv_pw_conv2d" in layer_names, has_expansion)
+        self.assertEqual("block_conv_pw_bn" in layer_names, has_expansion)
+        self.assertEqual(
+            any("block_conv_pw_" in path for path in weight_paths),
+            has_expansion,
+        )
+        self.assertIn("block_conv_dw_dwconv2d", layer_names)
+        self.assertIn("block_conv_pwl_conv2d", layer_names)
+        self.assertEqual(model.output_shape, (None, 8, 8, 16))
+
+    def test_skip_unit_expansion_with_expansion(self):
+        # The expansion is kept if it changes the number of channels
+        inputs = layers.Input(shape=(8, 8, 16))
+        outputs = apply_inverted_residual_block(
+            inputs,
+            name="block",
+            filters=16,
+            expansion_ratio=4.0,
+            skip_unit_expansion=True,
+        )
+        model = models.Model(inputs, outputs)
+        layer = model.get_layer("block_conv_pw_conv2d")
+        self.assertEqual(layer.filters, 64)
@@ -4,6 +4,7 @@ from keras import backend
 from keras import layers
 
 from kimm._src.kimm_export import kimm_export
+from kimm._src.utils.data_format import get_channels_axis
 from kimm._src.utils.make_divisble import make_divisible
 
 
@@ -18,7 +19,7 @@ def apply_se_block(
     name: str = "se_block",
 ):
     """Squeeze and Excitation."""
-    channels_axis = -1 if backend.image_data_format() == "channels_last" else -3
+    channels_axis = get_channels_axis()
     input_channels = inputs.shape[channels_axis]
     if se_input_channels is None:
         se_input_channels = input_channels
@@ -1,10 +1,13 @@
 import typing
+import warnings
 
 from keras import backend
 from keras import layers
 
 from kimm._src.kimm_export import kimm_export
 from kimm._src.layers.attention import Attention
+from kimm._src.layers.gelu_dropout import GeluDropout
+from kimm._src.utils.dtype_utils import get_dtype_policy
 
 
 @kimm_export(parent_path=["kimm.blocks"])
@@ -17,9 +20,18 @@ def apply_mlp_block(
     dropout_rate: float = 0.0,
     use_conv_mlp: bool = False,
     data_format: typing.Optional[str] = None,
+    compute_dtype: typing.Optional[str] = None,
     name: str = "mlp_block",
 ):
-    """Dense/Conv2D + Activation + Dense/Conv2D."""
+    """Dense/Conv2D + Activation + Dense/Conv2D.
+
+    If `compute_dtype` is `"float16"` or `"bfloat16"`, the block runs with
+    the corresponding mixed precision policy: the weights are kept in float32
+    while the GEMMs run in `compute_dtype`.
+
+    The `Dropout` layers are omitted if `dropout_rate=0.0`.
+    """
+    dtype = get_dtype_policy(compute_dtype)
     if data_format is None:
         data_format = backend.image_data_format()
     dim_axis = -1 if data_format == "channels_last" else 1
@@ -29,19 +41,38 @@ def apply_mlp_block(
     x = inputs
     if use_conv_mlp:
         x = layers.Conv2D(
-            hidden_dim, 1, use_bias=use_bias, name=f"{name}_fc1_conv2d"
+            hidden_dim,
+            1,
+            use_bias=use_bias,
+            dtype=dtype,
+            name=f"{name}_fc1_conv2d",
+        )(x)
+    else:
+        x = layers.Dense(
+            hidden_dim, use_bias=use_bias, dtype=dtype, name=f"{name}_fc1"
         )(x)
+    if activation == "gelu":
+        x = GeluDropout(dropout_rate, dtype=dtype, name=f"{name}_act")(x)
     else:
-        x = layers.Dense(hidden_dim, use_bias=use_bias, name=f"{name}_fc1")(x)
-    x = layers.Activation(activation, name=f"{name}_act")(x)
-    x = layers.Dropout(dropout_rate, name=f"{name}_drop1")(x)
+        x = layers.Activation(activation, dtype=dtype, name=f"{name}_act")(x)
+        if dropout_rate > 0:
+            x = layers.Dropout(dropout_rate, dtype=dtype, name=f"{name}_drop1")(
+                x
+            )
     if use_conv_mlp:
         x = layers.Conv2D(
-            output_dim, 1, use_bias=use_bias, name=f"{name}_fc2_conv2d"
+            output_dim,
+            1,
+            use_bias=use_bias,
+            dtype=dtype,
+            name=f"{name}_fc2_conv2d",
         )(x)
     else:
-        x = layers.Dense(output_dim, use_bias=use_bias, name=f"{name}_fc2")(x)
-    x = layers.Dropout(dropout_rate, name=f"{name}_drop2")(x)
+        x = layers.Dense(
+            output_dim, use_bias=use_bias, dtype=dtype, name=f"{name}_fc2"
+        )(x)
+    if dropout_rate > 0:
+        x = layers.Dropout(dropout_rate, dtype=dtype, name=f"{name}_drop2")(x)
     return x
 
 
@@ -55,10 +86,32 @@ def apply_transformer_block(
     projection_dropout_rate: float = 0.0,
     attention_dropout_rate: float = 0.0,
     activation: str = "gelu",
+    compute_dtype: typing.Optional[str] = None,
+    mlp_align: typing.Optional[int] = None,
     name: str = "transformer_block",
 ):
-    """LN + Attention + LN + MLP block."""
+    """LN + Attention + LN + MLP block.
+
+    If `compute_dtype` is `"float16"` or `"bfloat16"`, the attention and the
+    MLP run with the corresponding mixed precision policy. The
+    `LayerNormalization` and the residual additions keep the default dtype
+    policy to avoid precision loss at the residual path.
+
+    If `mlp_align` is specified, the hidden dim of the MLP is padded up to a
+    multiple of `mlp_align` (e.g. 64 for float16/bfloat16 Tensor Cores). Note
+    that this changes the weight shapes and is incompatible with pretrained
+    weights that were trained with the unpadded hidden dim.
+    """
     # data_format must be "channels_last"
+    hidden_dim = int(dim * mlp_ratio)
+    if mlp_align is not None:
+        hidden_dim = -(-hidden_dim // mlp_align) * mlp_align
+        if (dim // num_heads) % 8 != 0:
+            warnings.warn(
+                f"The head dim of {name} (dim // num_heads = "
+                f"{dim // num_heads}) is not a multiple of 8, which results in "
+                "unaligned attention GEMMs."
+            )
     x = inputs
     residual_1 = x
 
@@ -69,6 +122,7 @@ def apply_transformer_block(
         use_qkv_bias,
         attention_dropout_rate,
         projection_dropout_rate,
+        dtype=get_dtype_policy(compute_dtype),
         name=f"{name}_attn",
     )(x)
     x = layers.Add()([residual_1, x])
@@ -77,10 +131,11 @@ def apply_transformer_block(
     x = layers.LayerNormalization(epsilon=1e-6, name=f"{name}_norm2")(x)
     x = apply_mlp_block(
         x,
-        int(dim * mlp_ratio),
+        hidden_dim,
         activation=activation,
         dropout_rate=projection_dropout_rate,
         data_format="channels_last",
+        compute_dtype=compute_dtype,
         name=f"{name}_mlp",
     )
     x = layers.Add()([residual_2, x])
@@ -0,0 +1,87 @@
+from unittest import mock
+
+import numpy as np
+from absl.testing import parameterized
+from keras import layers
+from keras import models
+from keras import ops
+from keras.src import testing
+
+from kimm._src.blocks.transformer import apply_transformer_block
+
+
+class TransformerBlockTest(testing.TestCase, parameterized.TestCase):
+    @parameterized.named_parameters(
+        ("float16", "float16"), ("bfloat16", "bfloat16")
+    )
+    def test_compute_dtype(self, compute_dtype):
+        inputs = layers.Input(shape=(16, 32))
+        outputs = apply_transformer_block(
+            inputs,
+            name="block",
+            dim=32,
+            num_heads=4,
+            compute_dtype=compute_dtype,
+        )
+        model = models.Model(inputs, outputs)
+
+        # GEMMs run in compute_dtype with float32 weights
+        for name in ("block_attn", "block_mlp_fc1", "block_mlp_fc2"):
+            layer = model.get_layer(name)
+            self.assertEqual(layer.compute_dtype, compute_dtype)
+            self.assertEqual(layer.variable_dtype, "float32")
+        attention = model.get_layer("block_attn")
+        self.assertEqual(attention.qkv.compute_dtype, compute_dtype)
+        self.assertEqual(attention.projection.compute_dtype, compute_dtype)
+
+        # LayerNormalization and the residual path stay in float32
+        for name in ("block_norm1", "block_norm2"):
+            self.assertEqual(model.get_layer(name).compute_dtype, "float32")
+        self.assertEqual(model.output.dtype, "float32")
+
+        # Softmax runs in float32
+        softmax_dtypes = []
+
+        def softmax(x, *args, **kwargs):
+            softmax_dtypes.append(ops.dtype(x))
+            return original_softmax(x, *args, **kwargs)
+
+        original_softmax = ops.softmax
+        x = np.random.uniform(size=(2, 16, 32)).astype("float32")
+        with mock.patch.object(ops, "softmax", softmax):
+            y = model(x, training=False)
+        self.assertEqual(softmax_dtypes, ["float32"])
+        self.assertEqual(ops.dtype(y), "float32")
+
+    def test_mlp_align(self):
+        # int(64 * 7.984375) = 511
+        inputs = layers.Input(shape=(16, 64))
+        outputs = apply_transformer_block(
+            inputs, name="block", dim=64, num_heads=8, mlp_ratio=7.984375
+        )
+        model = models.Model(inputs, outputs)
+        self.assertEqual(model.get_layer("block_mlp_fc1").units, 511)
+
+        inputs = layers.Input(shape=(16, 64))
+        outputs = apply_transformer_block(
+            inputs,
+            name="block",
+            dim=64,
+            num_heads=8,
+            mlp_ratio=7.984375,
+            mlp_align=64,
+        )
+        model = models.Model(inputs, outputs)
+        self.assertEqual(model.get_layer("block_mlp_fc1").units, 512)
+        self.assertEqual(model.get_layer("block_mlp_fc2").units, 64)
+        self.assertEqual(model.output_shape, (None, 16, 64))
+
+    def test_mlp_align_head_dim_warning(self):
+        # head_dim = 60 // 5 = 12
+        inputs = layers.Input(shape=(16, 60))
+        with self.assertWarnsRegex(UserWarning, "not a multiple of 8"):
+            outputs = apply_transformer_block(
+                inputs, name="block", dim=60, num_heads=5, mlp_align=64
+            )
+        model = models.Model(inputs, outputs)
+        self.assertEqual(model.get_layer("block_mlp_fc1").units, 256)
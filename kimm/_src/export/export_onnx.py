@@ -21,11 +21,15 @@ def export_onnx(
     """Export the model to onnx format (in float32).
 
     Only torch backend with 'channels_first' is supported. The onnx model will
-    be generated using `torch.onnx.export` and optimized through `onnxsim` and
-    `onnxoptimizer`.
+    be generated using `torch.onnx.export` with constant folding under
+    `torch.no_grad()` and optimized through `onnxsim` and `onnxoptimizer`.
 
-    Note that `onnx`, `onnxruntime`, `onnxsim` and `onnxoptimizer` must be
-    installed.
+    Note that `onnx`, `onnxruntime`, `onnxscript`, `onnxsim` and
+    `onnxoptimizer` must be installed.
+
+    The pretrained weights are layout-agnostic (conv kernels are always stored
+    as `[kH, kW, Cin, Cout]`), so a model built with 'channels_first' can load
+    the same weights as one built with 'channels_last'.
 
     Args:
         model: keras.Model, the model to be exported.
@@ -43,12 +47,14 @@ def export_onnx(
     try:
         import onnx
         import onnxoptimizer
+        import onnxscript  # noqa: F401 (required by `torch.onnx.export`)
         import onnxsim
     except ModuleNotFoundError:
         raise ModuleNotFoundError(
-            "Failed to import 'onnx', 'onnxsim' or 'onnxoptimizer'. "
-            "Please install them by the following instruction:\n"
-            "'pip install torch onnx onnxsim onnxoptimizer'"
+            "Failed to import 'onnx', 'onnxscript', 'onnxsim' or "
+            "'onnxoptimizer'. Please install them by the following "
+            "instruction:\n"
+            "'pip install torch onnx onnxscript onnxsim onnxoptimizer'"
         )
 
     if isinstance(input_shape, int):
@@ -66,12 +72,15 @@ def export_onnx(
     model = models.Model(inputs, outputs)
     model = model.eval()
 
-    full_input_shape = [1] + list(input_shape)
+    full_input_shape = [batch_size] + list(input_shape)
     dummy_inputs = ops.ones(full_input_shape, dtype="float32")
-    scripted_model = torch.jit.trace(
-        model.forward, example_inputs=[dummy_inputs]
-    )
-    torch.onnx.export(scripted_model, dummy_inputs, export_path)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy_inputs,),
+            export_path,
+            do_constant_folding=True,
+        )
 
     # Further optimization
     model = onnx.load(export_path)
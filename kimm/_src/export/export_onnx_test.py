@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from absl.testing import parameterized
 from keras import backend
@@ -9,7 +10,10 @@ from kimm._src.export import export_onnx
 
 class ExportOnnxTest(testing.TestCase, parameterized.TestCase):
     def get_model(self):
-        input_shape = [3, 224, 224]  # channels_first
+        if backend.image_data_format() == "channels_last":
+            input_shape = [224, 224, 3]
+        else:
+            input_shape = [3, 224, 224]
         model = models.mobilenet_v3.MobileNetV3W050Small(
             include_preprocessing=False, weights=None
         )
@@ -23,16 +27,48 @@ class ExportOnnxTest(testing.TestCase, parameterized.TestCase):
     def tearDownClass(cls):
         backend.set_image_data_format(cls.original_image_data_format)
 
+    def setUp(self):
+        super().setUp()
+        backend.set_image_data_format("channels_last")
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch", reason="Requires torch backend."
+    )
+    def test_export_onnx_invalid_data_format(self):
+        # torch transposes NHWC inputs around every conv, so the onnx export
+        # requires the native 'channels_first' layout
+        input_shape, model = self.get_model()
+
+        temp_dir = self.get_temp_dir()
+
+        with self.assertRaisesRegex(ValueError, "'channels_first'"):
+            export_onnx.export_onnx(
+                model, input_shape, f"{temp_dir}/model.onnx"
+            )
+
     @pytest.mark.skipif(
         backend.backend() != "torch", reason="Requires torch backend."
     )
-    def DISABLE_test_export_onnx_use(self):
-        # TODO: turn on this test
-        # SystemError: <method '__int__' of 'torch._C._TensorBase' objects>
-        # returned a result with an exception set
+    def test_export_onnx_use(self):
         backend.set_image_data_format("channels_first")
         input_shape, model = self.get_model()
 
         temp_dir = self.get_temp_dir()
 
         export_onnx.export_onnx(model, input_shape, f"{temp_dir}/model.onnx")
+
+        self.assertOnnxOutputsClose(
+            f"{temp_dir}/model.onnx", model, input_shape
+        )
+
+    def assertOnnxOutputsClose(self, export_path, model, input_shape):
+        import onnxruntime
+
+        x = np.random.uniform(size=[1] + input_shape).astype("float32")
+        session = onnxruntime.InferenceSession(
+            export_path, providers=["CPUExecutionProvider"]
+        )
+        input_name = session.get_inputs()[0].name
+        y1 = session.run(None, {input_name: x})[0]
+        y2 = model.predict(x, verbose=0)
+        self.assertAllClose(y1, y2, atol=1e-5, rtol=1e-5)
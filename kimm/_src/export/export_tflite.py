@@ -16,7 +16,9 @@ def export_tflite(
     model: BaseModel,
     input_shape: typing.Union[int, typing.Sequence[int]],
     export_path: typing.Union[str, pathlib.Path],
-    export_dtype: typing.Literal["float32", "float16", "int8"] = "float32",
+    export_dtype: typing.Literal[
+        "float32", "float16", "dynamic", "int8"
+    ] = "float32",
     representative_dataset: typing.Optional[typing.Iterator] = None,
     batch_size: int = 1,
 ):
@@ -27,8 +29,10 @@ def export_tflite(
     `tf.lite.TFLiteConverter.from_saved_model` and optimized through tflite
     built-in functions.
 
-    Note that when exporting an `int8` tflite model, `representative_dataset`
-    must be passed.
+    `"dynamic"` applies dynamic range quantization: the weights are stored in
+    int8 and the activations are quantized on the fly, so no
+    `representative_dataset` is needed. Note that when exporting an `int8`
+    (full integer) tflite model, `representative_dataset` must be passed.
 
     Args:
         model: keras.Model, the model to be exported.
@@ -46,9 +50,10 @@ def export_tflite(
         raise ValueError(
             "`export_tflite` only supports 'channels_last' data format."
         )
-    if export_dtype not in ("float32", "float16", "int8"):
+    if export_dtype not in ("float32", "float16", "dynamic", "int8"):
         raise ValueError(
-            "`export_dtype` must be one of ('float32', 'float16', 'int8'). "
+            "`export_dtype` must be one of "
+            "('float32', 'float16', 'dynamic', 'int8'). "
             f"Received: export_dtype={export_dtype}"
         )
     if export_dtype == "int8" and representative_dataset is None:
@@ -1,9 +1,13 @@
+import os
+
+import numpy as np
 import pytest
 from absl.testing import parameterized
 from keras import backend
 from keras import ops
 from keras import random
 from keras.src import testing
+from keras.src.utils.module_utils import tensorflow as tf
 
 from kimm._src import models
 from kimm._src.export import export_tflite
@@ -56,6 +60,51 @@ class ExportTFLiteTest(testing.TestCase, parameterized.TestCase):
             model, input_shape, f"{temp_dir}/model_fp16.tflite", "float16"
         )
 
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow", reason="Requires tensorflow backend."
+    )
+    def test_export_tflite_dynamic(self):
+        input_shape = [224, 224, 3]
+        # Compare logits since the softmax of a randomly initialized model is
+        # nearly uniform
+        model = models.mobilenet_v3.MobileNetV3W050Small(
+            include_preprocessing=False,
+            classifier_activation="linear",
+            weights=None,
+        )
+        temp_dir = self.get_temp_dir()
+
+        export_tflite.export_tflite(
+            model, input_shape, f"{temp_dir}/model_fp32.tflite", "float32"
+        )
+        export_tflite.export_tflite(
+            model, input_shape, f"{temp_dir}/model_dynamic.tflite", "dynamic"
+        )
+
+        # The weights are stored in int8
+        interpreter = tf.lite.Interpreter(
+            model_path=f"{temp_dir}/model_dynamic.tflite"
+        )
+        interpreter.allocate_tensors()
+        tensor_dtypes = [t["dtype"] for t in interpreter.get_tensor_details()]
+        self.assertIn(np.int8, tensor_dtypes)
+        self.assertLess(
+            os.path.getsize(f"{temp_dir}/model_dynamic.tflite"),
+            os.path.getsize(f"{temp_dir}/model_fp32.tflite") / 2,
+        )
+
+        # The outputs stay close to the keras model
+        x = np.random.uniform(size=[1, *input_shape]).astype("float32")
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        interpreter.set_tensor(input_details["index"], x)
+        interpreter.invoke()
+        y1 = interpreter.get_tensor(output_details["index"])
+        y2 = model.predict(x, verbose=0)
+        scale = np.max(np.abs(y2))
+        self.assertAllClose(y1 / scale, y2 / scale, atol=0.05, rtol=0.0)
+        self.assertEqual(np.argmax(y1), np.argmax(y2))
+
     @pytest.mark.skipif(
         backend.backend() != "tensorflow", reason="Requires tensorflow backend."
     )
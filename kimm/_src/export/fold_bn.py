@@ -0,0 +1,120 @@
+import typing
+
+import numpy as np
+from keras import layers
+from keras import models
+from keras import ops
+
+from kimm._src.kimm_export import kimm_export
+
+
+def _get_foldable_pairs(model: models.Model):
+    """Find `Conv2D|DepthwiseConv2D -> BatchNormalization` pairs.
+
+    A pair is foldable if the conv layer is linear, called once and only
+    consumed by the BN layer, and the BN layer normalizes the channels axis.
+    """
+    pairs: typing.Dict[int, typing.Tuple[layers.Layer, layers.Layer]] = {}
+    for layer in model.layers:
+        if not isinstance(layer, layers.BatchNormalization):
+            continue
+        if len(layer._inbound_nodes) != 1:
+            continue
+        parent_nodes = layer._inbound_nodes[0].parent_nodes
+        if len(parent_nodes) != 1:
+            continue
+        conv = parent_nodes[0].operation
+        if not isinstance(conv, (layers.Conv2D, layers.DepthwiseConv2D)):
+            continue
+        if len(conv._inbound_nodes) != 1 or len(conv._outbound_nodes) != 1:
+            continue
+        if conv.get_config()["activation"] != "linear":
+            continue
+        channels_axis = 3 if conv.data_format == "channels_last" else 1
+        if layer.axis % 4 != channels_axis:
+            continue
+        pairs[id(conv)] = (conv, layer)
+    return pairs
+
+
+def _get_folded_conv(conv: layers.Layer, bn: layers.BatchNormalization):
+    """Build a new conv layer with `bn` folded into its kernel and bias."""
+    # Use float64 for better precision
+    kernel = ops.convert_to_numpy(conv.kernel).astype("float64")
+    moving_mean = ops.convert_to_numpy(bn.moving_mean).astype("float64")
+    moving_variance = ops.convert_to_numpy(bn.moving_variance).astype("float64")
+    filters = moving_mean.shape[0]
+    gamma = np.ones([filters], dtype="float64")
+    beta = np.zeros([filters], dtype="float64")
+    bias = np.zeros([filters], dtype="float64")
+    if bn.scale:
+        gamma = ops.convert_to_numpy(bn.gamma).astype("float64")
+    if bn.center:
+        beta = ops.convert_to_numpy(bn.beta).astype("float64")
+    if conv.use_bias:
+        bias = ops.convert_to_numpy(conv.bias).astype("float64")
+
+    t = gamma / np.sqrt(moving_variance + bn.epsilon)
+    if isinstance(conv, layers.DepthwiseConv2D):
+        # [kh, kw, input_filters, depth_multiplier]
+        kernel = kernel * np.reshape(t, [1, 1, *kernel.shape[-2:]])
+    else:
+        # [kh, kw, input_filters // groups, filters]
+        kernel = kernel * np.reshape(t, [1, 1, 1, -1])
+    bias = beta + (bias - moving_mean) * t
+
+    config = conv.get_config()
+    config["use_bias"] = True
+    folded_conv = conv.__class__.from_config(config)
+    folded_conv.build(conv._inbound_nodes[0].input_tensors[0].shape)
+    folded_conv.kernel.assign(kernel.astype(folded_conv.kernel.dtype))
+    folded_conv.bias.assign(bias.astype(folded_conv.bias.dtype))
+    return folded_conv
+
+
+@kimm_export(parent_path=["kimm.export"])
+def fold_batchnorm(model: models.Model):
+    """Fold `BatchNormalization` into the preceding convolution.
+
+    Each `Conv2D|DepthwiseConv2D -> BatchNormalization` pair in the functional
+    graph of `model` is replaced by a single convolution with
+    `use_bias=True`, where
+    `kernel' = kernel * gamma / sqrt(moving_variance + epsilon)` and
+    `bias' = beta + (bias - moving_mean) * gamma / sqrt(moving_variance +
+    epsilon)`. This removes one memory-bound op per pair at inference.
+
+    Note that the returned model is only valid for inference and that the
+    layers other than the folded pairs are shared with `model`.
+
+    Args:
+        model: A functional `keras.Model` such as `BaseModel`.
+
+    Returns:
+        A new functional `keras.Model` with the same inputs and outputs.
+    """
+    if not hasattr(model, "_run_through_graph"):
+        raise ValueError(
+            "`fold_batchnorm` only supports functional models. "
+            f"Received: model type={type(model)}"
+        )
+    pairs = _get_foldable_pairs(model)
+    folded_convs = {}
+    folded_bns = set()
+    for conv_id, (conv, bn) in pairs.items():
+        folded_convs[conv_id] = _get_folded_conv(conv, bn)
+        folded_bns.add(id(bn))
+
+    def operation_fn(operation):
+        if id(operation) in folded_convs:
+            return folded_convs[id(operation)]
+        if id(operation) in folded_bns:
+            return lambda x, *args, **kwargs: x
+        return operation
+
+    inputs = [
+        layers.Input(batch_shape=x.shape, dtype=x.dtype) for x in model.inputs
+    ]
+    outputs = model._run_through_graph(inputs, operation_fn=operation_fn)
+    if len(inputs) == 1:
+        inputs = inputs[0]
+    return models.Model(inputs, outputs, name=model.name)
@@ -0,0 +1,53 @@
+import numpy as np
+from absl.testing import parameterized
+from keras import layers
+from keras import models
+from keras import random
+from keras.src import testing
+
+from kimm._src import models as kimm_models
+from kimm._src.export import fold_bn
+
+
+class FoldBatchNormTest(testing.TestCase, parameterized.TestCase):
+    def randomize_moving_statistics(self, model):
+        rng = np.random.default_rng(2024)
+        for weight in model.non_trainable_weights:
+            weight.assign(rng.uniform(0.5, 1.5, weight.shape))
+
+    def test_fold_batchnorm(self):
+        model = kimm_models.mobilenet_v3.MobileNetV3W050Small(
+            input_shape=[64, 64, 3], include_preprocessing=False, weights=None
+        )
+        self.randomize_moving_statistics(model)
+        x = random.uniform([1, 64, 64, 3], seed=2024)
+        y1 = model(x, training=False)
+
+        folded_model = fold_bn.fold_batchnorm(model)
+        y2 = folded_model(x, training=False)
+
+        self.assertAllClose(y1, y2, atol=1e-5)
+        for layer in folded_model.layers:
+            self.assertNotIsInstance(layer, layers.BatchNormalization)
+
+    def test_fold_batchnorm_skip(self):
+        # The BN follows an activated conv and must be kept
+        inputs = layers.Input([8, 8, 3])
+        x = layers.Conv2D(4, 3, activation="relu")(inputs)
+        x = layers.BatchNormalization()(x)
+        x = layers.DepthwiseConv2D(3, depth_multiplier=2, use_bias=True)(x)
+        x = layers.BatchNormalization()(x)
+        model = models.Model(inputs, x)
+        self.randomize_moving_statistics(model)
+        x = random.uniform([1, 8, 8, 3], seed=2024)
+        y1 = model(x, training=False)
+
+        folded_model = fold_bn.fold_batchnorm(model)
+        y2 = folded_model(x, training=False)
+
+        self.assertAllClose(y1, y2, atol=1e-5)
+        num_bn = sum(
+            isinstance(layer, layers.BatchNormalization)
+            for layer in folded_model.layers
+        )
+        self.assertEqual(num_bn, 1)
@@ -105,7 +105,12 @@ class Attention(layers.Layer):
         # attention
         q = ops.multiply(q, self.scale)
         attn = ops.matmul(q, ops.swapaxes(k, -2, -1))
-        attn = ops.softmax(attn)
+        if self.compute_dtype in ("float16", "bfloat16"):
+            # Keep the softmax in float32 to avoid overflow and precision loss
+            attn = ops.softmax(ops.cast(attn, "float32"))
+            attn = ops.cast(attn, self.compute_dtype)
+        else:
+            attn = ops.softmax(attn)
         attn = self.attention_dropout(attn)
         x = ops.matmul(attn, v)
         x = ops.reshape(ops.swapaxes(x, -3, -2), input_shape)
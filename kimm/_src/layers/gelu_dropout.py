@@ -0,0 +1,57 @@
+import keras
+from keras import activations
+from keras import layers
+from keras import random
+
+from kimm._src.kimm_export import kimm_export
+
+
+@kimm_export(parent_path=["kimm.layers"])
+@keras.saving.register_keras_serializable(package="kimm")
+class GeluDropout(layers.Layer):
+    """GELU followed by Dropout in a single layer.
+
+    Both ops are elementwise, so computing them in one `call` allows the
+    compiler (XLA, `torch.compile`) to fuse them into one pass.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        approximate: bool = False,
+        seed=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if not 0 <= rate <= 1:
+            raise ValueError(
+                "Invalid value received for argument `rate`. Expected a float "
+                f"value between 0 and 1. Received: rate={rate}"
+            )
+        self.rate = rate
+        self.approximate = approximate
+        self.seed = seed
+        if rate > 0:
+            self.seed_generator = random.SeedGenerator(seed)
+        self.supports_masking = True
+        self.built = True
+
+    def call(self, inputs, training=False):
+        x = activations.gelu(inputs, approximate=self.approximate)
+        if training and self.rate > 0:
+            x = random.dropout(x, self.rate, seed=self.seed_generator)
+        return x
+
+    def compute_output_shape(self, input_shape):
+        return input_shape
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "rate": self.rate,
+                "approximate": self.approximate,
+                "seed": self.seed,
+            }
+        )
+        return config
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from absl.testing import parameterized
+from keras import activations
+from keras.src import testing
+
+from kimm._src.layers.gelu_dropout import GeluDropout
+
+
+class GeluDropoutTest(testing.TestCase, parameterized.TestCase):
+    @pytest.mark.requires_trainable_backend
+    def test_basic(self):
+        self.run_layer_test(
+            GeluDropout,
+            init_kwargs={"rate": 0.5},
+            input_shape=(1, 10),
+            expected_output_shape=(1, 10),
+            expected_num_trainable_weights=0,
+            expected_num_non_trainable_weights=0,
+            expected_num_seed_generators=1,
+            expected_num_losses=0,
+            supports_masking=True,
+        )
+
+    def test_inference(self):
+        x = np.random.uniform(-3, 3, (2, 10)).astype("float32")
+        layer = GeluDropout(rate=0.5)
+
+        y = layer(x, training=False)
+
+        self.assertAllClose(y, activations.gelu(x, approximate=False))
@@ -4,7 +4,6 @@ import typing
 import warnings
 
 import keras
-from keras import backend
 from keras import layers
 
 from kimm._src.blocks.conv2d import apply_conv2d_block
@@ -14,75 +13,94 @@ from kimm._src.blocks.depthwise_separation import (
 from kimm._src.blocks.inverted_residual import apply_inverted_residual_block
 from kimm._src.kimm_export import kimm_export
 from kimm._src.models.base_model import BaseModel
+from kimm._src.utils.dtype_utils import dtype_policy_scope
 from kimm._src.utils.make_divisble import make_divisible
 from kimm._src.utils.model_registry import add_model_to_registry
 
-DEFAULT_SMALL_CONFIG = [
-    # type, repeat, kernel_size, strides, expansion_ratio, channels, se_ratio,
-    # activation
+
+class BlockCfg(typing.NamedTuple):
+    block_type: str
+    repeat: int
+    kernel_size: int
+    strides: int
+    expansion_ratio: float
+    channels: int
+    se_ratio: float
+    activation: str
+
+
+DEFAULT_SMALL_CONFIG = (
     # stage0
-    [["ds", 1, 3, 2, 1.0, 16, 0.25, "relu"]],
+    (BlockCfg("ds", 1, 3, 2, 1.0, 16, 0.25, "relu"),),
     # stage1
-    [
-        ["ir", 1, 3, 2, 4.5, 24, 0.0, "relu"],
-        ["ir", 1, 3, 1, 3.67, 24, 0.0, "relu"],
-    ],
+    (
+        BlockCfg("ir", 1, 3, 2, 4.5, 24, 0.0, "relu"),
+        BlockCfg("ir", 1, 3, 1, 3.67, 24, 0.0, "relu"),
+    ),
     # stage2
-    [
-        ["ir", 1, 5, 2, 4.0, 40, 0.25, "hard_swish"],
-        ["ir", 2, 5, 1, 6.0, 40, 0.25, "hard_swish"],
-    ],
+    (
+        BlockCfg("ir", 1, 5, 2, 4.0, 40, 0.25, "hard_swish"),
+        BlockCfg("ir", 2, 5, 1, 6.0, 40, 0.25, "hard_swish"),
+    ),
     # stage3
-    [["ir", 2, 5, 1, 3.0, 48, 0.25, "hard_swish"]],
+    (BlockCfg("ir", 2, 5, 1, 3.0, 48, 0.25, "hard_swish"),),
     # stage4
-    [["ir", 3, 5, 2, 6.0, 96, 0.25, "hard_swish"]],
+    (BlockCfg("ir", 3, 5, 2, 6.0, 96, 0.25, "hard_swish"),),
     # stage5
-    [["cn", 1, 1, 1, 1.0, 576, 0.0, "hard_swish"]],
-]
-DEFAULT_LARGE_CONFIG = [
-    # type, repeat, kernel_size, strides, expansion_ratio, channels, se_ratio,
-    # activation
+    (BlockCfg("cn", 1, 1, 1, 1.0, 576, 0.0, "hard_swish"),),
+)
+DEFAULT_LARGE_CONFIG = (
     # stage0
-    [["ds", 1, 3, 1, 1.0, 16, 0.0, "relu"]],
+    (BlockCfg("ds", 1, 3, 1, 1.0, 16, 0.0, "relu"),),
     # stage1
-    [
-        ["ir", 1, 3, 2, 4.0, 24, 0.0, "relu"],
-        ["ir", 1, 3, 1, 3.0, 24, 0.0, "relu"],
-    ],
+    (
+        BlockCfg("ir", 1, 3, 2, 4.0, 24, 0.0, "relu"),
+        BlockCfg("ir", 1, 3, 1, 3.0, 24, 0.0, "relu"),
+    ),
     # stage2
-    [["ir", 3, 5, 2, 3.0, 40, 0.25, "relu"]],
+    (BlockCfg("ir", 3, 5, 2, 3.0, 40, 0.25, "relu"),),
     # stage3
-    [
-        ["ir", 1, 3, 2, 6.0, 80, 0.0, "hard_swish"],
-        ["ir", 1, 3, 1, 2.5, 80, 0.0, "hard_swish"],
-        ["ir", 2, 3, 1, 2.3, 80, 0.0, "hard_swish"],
-    ],
+    (
+        BlockCfg("ir", 1, 3, 2, 6.0, 80, 0.0, "hard_swish"),
+        BlockCfg("ir", 1, 3, 1, 2.5, 80, 0.0, "hard_swish"),
+        BlockCfg("ir", 2, 3, 1, 2.3, 80, 0.0, "hard_swish"),
+    ),
     # stage4
-    [["ir", 2, 3, 1, 6.0, 112, 0.25, "hard_swish"]],
+    (BlockCfg("ir", 2, 3, 1, 6.0, 112, 0.25, "hard_swish"),),
     # stage5
-    [["ir", 3, 5, 2, 6.0, 160, 0.25, "hard_swish"]],
+    (BlockCfg("ir", 3, 5, 2, 6.0, 160, 0.25, "hard_swish"),),
     # stage6
-    [["cn", 1, 1, 1, 1.0, 960, 0.0, "hard_swish"]],
-]
-DEFAULT_LCNET_CONFIG = [
-    # type, repeat, kernel_size, strides, expansion_ratio, channels, se_ratio,
-    # activation
+    (BlockCfg("cn", 1, 1, 1, 1.0, 960, 0.0, "hard_swish"),),
+)
+DEFAULT_LCNET_CONFIG = (
     # stage0
-    [["dsa", 1, 3, 1, 1.0, 32, 0.0, "hard_swish"]],
+    (BlockCfg("dsa", 1, 3, 1, 1.0, 32, 0.0, "hard_swish"),),
     # stage1
-    [["dsa", 2, 3, 2, 1.0, 64, 0.0, "hard_swish"]],
+    (BlockCfg("dsa", 2, 3, 2, 1.0, 64, 0.0, "hard_swish"),),
     # stage2
-    [["dsa", 2, 3, 2, 1.0, 128, 0.0, "hard_swish"]],
+    (BlockCfg("dsa", 2, 3, 2, 1.0, 128, 0.0, "hard_swish"),),
     # stage3
-    [
-        ["dsa", 1, 3, 2, 1.0, 256, 0.0, "hard_swish"],
-        ["dsa", 1, 5, 1, 1.0, 256, 0.0, "hard_swish"],
-    ],
+    (
+        BlockCfg("dsa", 1, 3, 2, 1.0, 256, 0.0, "hard_swish"),
+        BlockCfg("dsa", 1, 5, 1, 1.0, 256, 0.0, "hard_swish"),
+    ),
     # stage4
-    [["dsa", 4, 5, 1, 1.0, 256, 0.0, "hard_swish"]],
+    (BlockCfg("dsa", 4, 5, 1, 1.0, 256, 0.0, "hard_swish"),),
     # stage5
-    [["dsa", 2, 5, 2, 1.0, 512, 0.25, "hard_swish"]],
-]
+    (BlockCfg("dsa", 2, 5, 2, 1.0, 512, 0.25, "hard_swish"),),
+)
+_SMALL_FEATURE_KEYS = (
+    "STEM_S2",
+    *(f"BLOCK{i}_S{j}" for i, j in zip(range(6), (4, 8, 16, 16, 32, 32))),
+)
+_LARGE_FEATURE_KEYS = (
+    "STEM_S2",
+    *(f"BLOCK{i}_S{j}" for i, j in zip(range(7), (2, 4, 8, 16, 16, 32, 32))),
+)
+_LCNET_FEATURE_KEYS = (
+    "STEM_S2",
+    *(f"BLOCK{i}_S{j}" for i, j in zip(range(6), (2, 4, 8, 16, 16, 32))),
+)
 
 
 @keras.saving.register_keras_serializable(package="kimm")
@@ -120,137 +138,163 @@ class MobileNetV3(BaseModel):
             force_activation = None
             force_kernel_size = None
             no_se = False
+        stem_and_head_activation = force_activation or "hard_swish"
         # TF default config
         bn_epsilon = kwargs.pop("bn_epsilon", 1e-5)
         padding = kwargs.pop("padding", None)
+        dtype = kwargs.pop("dtype", None)
 
         self.set_properties(kwargs)
-        channels_axis = (
-            -1 if backend.image_data_format() == "channels_last" else -3
-        )
-
-        inputs = self.determine_input_tensor(
-            input_tensor,
-            self._input_shape,
-            self._default_size,
-        )
-        x = inputs
-
-        x = self.build_preprocessing(x, "imagenet")
-
-        # Prepare feature extraction
-        features = {}
-
-        # stem
-        stem_channel = (
-            16 if fix_stem_and_head_channels else make_divisible(16 * width)
-        )
-        x = apply_conv2d_block(
-            x,
-            stem_channel,
-            3,
-            2,
-            activation=force_activation or "hard_swish",
-            bn_epsilon=bn_epsilon,
-            padding=padding,
-            name="conv_stem",
-        )
-        features["STEM_S2"] = x
 
-        # blocks
-        current_stride = 2
+        # Resolve the config with the overrides, width and depth
+        resolved_config = []
         for current_stage_idx, cfg in enumerate(_config):
-            for current_block_idx, sub_cfg in enumerate(cfg):
-                block_type, r, k, s, e, c, se, act = sub_cfg
-
-                # override default config
+            resolved_cfg = []
+            for sub_cfg in cfg:
+                _, r, k, _, _, c, se, act = sub_cfg
                 if force_activation is not None:
                     act = force_activation
                 if force_kernel_size is not None:
                     k = force_kernel_size if k > force_kernel_size else k
                 if no_se:
                     se = 0.0
-
-                c = make_divisible(c * width)
-                # no depth multiplier at first and last block
-                if current_block_idx not in (0, len(_config) - 1):
+                # All config channels are already divisible by 8
+                if width != 1.0:
+                    c = make_divisible(c * width)
+                # no depth multiplier at first and last stage
+                if depth != 1.0 and 0 < current_stage_idx < len(_config) - 1:
                     r = int(math.ceil(r * depth))
-                for current_layer_idx in range(r):
-                    s = s if current_layer_idx == 0 else 1
-                    _kwargs = {
-                        "bn_epsilon": bn_epsilon,
-                        "padding": padding,
-                        "name": (
-                            f"blocks_{current_stage_idx}_"
-                            f"{current_block_idx + current_layer_idx}"
-                        ),
-                    }
-                    if block_type in ("ds", "dsa"):
-                        if block_type == "dsa":
-                            has_skip = False
-                        else:
-                            has_skip = x.shape[channels_axis] == c and s == 1
-                        x = apply_depthwise_separation_block(
-                            x,
-                            c,
-                            k,
-                            1,
-                            s,
-                            se,
-                            act,
-                            se_activation="relu",
-                            se_gate_activation="hard_sigmoid",
-                            se_make_divisible_number=8,
-                            pw_activation=act if block_type == "dsa" else None,
-                            has_skip=has_skip,
-                            **_kwargs,
-                        )
-                    elif block_type == "ir":
-                        x = apply_inverted_residual_block(
-                            x,
-                            c,
-                            k,
-                            1,
-                            1,
-                            s,
-                            e,
-                            se,
-                            act,
-                            se_activation="relu",
-                            se_gate_activation="hard_sigmoid",
-                            se_make_divisible_number=8,
-                            **_kwargs,
-                        )
-                    elif block_type == "cn":
-                        x = apply_conv2d_block(
-                            x, c, k, s, activation=act, **_kwargs
-                        )
-                    current_stride *= s
-            features[f"BLOCK{current_stage_idx}_S{current_stride}"] = x
-
-        # Head
-        if self._include_top:
-            if fix_stem_and_head_channels:
-                conv_head_channels = conv_head_channels
-            else:
-                conv_head_channels = max(
-                    conv_head_channels,
-                    make_divisible(conv_head_channels * width),
+                resolved_cfg.append(
+                    sub_cfg._replace(
+                        repeat=r,
+                        kernel_size=k,
+                        channels=c,
+                        se_ratio=se,
+                        activation=act,
+                    )
                 )
-            head_activation = force_activation or "hard_swish"
-            x = self.build_top(
+            resolved_config.append(resolved_cfg)
+
+        # Build the layers with the given dtype policy
+        with dtype_policy_scope(dtype):
+            inputs = self.determine_input_tensor(
+                input_tensor,
+                self._input_shape,
+                self._default_size,
+            )
+            x = inputs
+
+            x = self.build_preprocessing(x, "imagenet")
+
+            # Prepare feature extraction
+            features = {}
+
+            # stem
+            stem_channel = (
+                16 if fix_stem_and_head_channels else make_divisible(16 * width)
+            )
+            x = apply_conv2d_block(
                 x,
-                self._classes,
-                self._classifier_activation,
-                self._dropout_rate,
-                conv_head_channels=conv_head_channels,
-                head_activation=head_activation,
+                stem_channel,
+                3,
+                2,
+                activation=stem_and_head_activation,
+                bn_epsilon=bn_epsilon,
+                padding=padding,
+                name="conv_stem",
             )
-        else:
-            if self._pooling == "avg":
-                x = layers.GlobalAveragePooling2D(name="avg_pool")(x)
-            elif self._pooling == "max":
-                x = layers.GlobalMaxPooling2D(name="max_pool")(x)
+            features["STEM_S2"] = x
+
+            # blocks
+            current_stride = 2
+            current_channels = stem_channel
+            block_kwargs = {"bn_epsilon": bn_epsilon, "padding": padding}
+            for current_stage_idx, cfg in enumerate(resolved_config):
+                current_block_idx = 0
+                for sub_cfg in cfg:
+                    block_type, r, k, _, e, c, se, act = sub_cfg
+                    for current_layer_idx in range(r):
+                        s = sub_cfg.strides if current_layer_idx == 0 else 1
+                        block_name = (
+                            f"blocks_{current_stage_idx}_{current_block_idx}"
+                        )
+                        if block_type in ("ds", "dsa"):
+                            if block_type == "dsa":
+                                has_skip = False
+                            else:
+                                has_skip = current_channels == c and s == 1
+                            x = apply_depthwise_separation_block(
+                                x,
+                                c,
+                                k,
+                                1,
+                                s,
+                                se,
+                                act,
+                                se_activation="relu",
+                                se_gate_activation="hard_sigmoid",
+                                se_make_divisible_number=8,
+                                pw_activation=(
+                                    act if block_type == "dsa" else None
+                                ),
+                                has_skip=has_skip,
+                                name=block_name,
+                                **block_kwargs,
+                            )
+                        elif block_type == "ir":
+                            x = apply_inverted_residual_block(
+                                x,
+                                c,
+                                k,
+                                1,
+                                1,
+                                s,
+                                e,
+                                se,
+                                act,
+                                se_activation="relu",
+                                se_gate_activation="hard_sigmoid",
+                                se_make_divisible_number=8,
+                                name=block_name,
+                                **block_kwargs,
+                            )
+                        elif block_type == "cn":
+                            x = apply_conv2d_block(
+                                x,
+                                c,
+                                k,
+                                s,
+                                activation=act,
+                                name=block_name,
+                                **block_kwargs,
+                            )
+                        current_stride *= s
+                        current_channels = c
+                        current_block_idx += 1
+                features[f"BLOCK{current_stage_idx}_S{current_stride}"] = x
+
+            # Head
+            if self._include_top:
+                if not fix_stem_and_head_channels:
+                    conv_head_channels = max(
+                        conv_head_channels,
+                        make_divisible(conv_head_channels * width),
+                    )
+                x = self.build_top(
+                    x,
+                    self._classes,
+                    self._classifier_activation,
+                    self._dropout_rate,
+                    conv_head_channels=conv_head_channels,
+                    head_activation=stem_and_head_activation,
+                    # Keep the classifier in float32 for numerical stability
+                    classifier_dtype="float32" if dtype else None,
+                )
+            else:
+                if self._pooling == "avg":
+                    x = layers.GlobalAveragePooling2D(name="avg_pool")(x)
+                elif self._pooling == "max":
+                    x = layers.GlobalMaxPooling2D(name="max_pool")(x)
 
         super().__init__(inputs=inputs, outputs=x, features=features, **kwargs)
 
@@ -260,6 +304,7 @@ class MobileNetV3(BaseModel):
         self.fix_stem_and_head_channels = fix_stem_and_head_channels
         self.config = config
         self.minimal = minimal
+        self.build_dtype = dtype
 
     def build_top(
         self,
@@ -269,18 +314,26 @@ class MobileNetV3(BaseModel):
         dropout_rate,
         conv_head_channels,
         head_activation,
+        classifier_dtype=None,
     ):
         x = layers.GlobalAveragePooling2D(name="avg_pool", keepdims=True)(
             inputs
         )
         x = layers.Conv2D(
-            conv_head_channels, 1, 1, use_bias=True, name="conv_head"
+            conv_head_channels,
+            1,
+            1,
+            activation=head_activation,
+            use_bias=True,
+            name="conv_head",
         )(x)
-        x = layers.Activation(head_activation, name="act2")(x)
-        x = layers.Flatten()(x)
+        x = layers.Reshape((conv_head_channels,))(x)
         x = layers.Dropout(rate=dropout_rate, name="conv_head_dropout")(x)
         x = layers.Dense(
-            classes, activation=classifier_activation, name="classifier"
+            classes,
+            activation=classifier_activation,
+            dtype=classifier_dtype,
+            name="classifier",
         )(x)
         return x
 
@@ -293,6 +346,7 @@ class MobileNetV3(BaseModel):
                 "fix_stem_and_head_channels": self.fix_stem_and_head_channels,
                 "config": self.config,
                 "minimal": self.minimal,
+                "dtype": self.build_dtype,
             }
         )
         return config
@@ -334,6 +388,7 @@ class MobileNetV3Variant(MobileNetV3):
         name: typing.Optional[str] = None,
         feature_extractor: bool = False,
         feature_keys: typing.Optional[typing.Sequence[str]] = None,
+        dtype: typing.Optional[str] = None,
         **kwargs,
     ):
         """Instantiates the MobileNetV3 or LCNet architecture.
@@ -373,6 +428,11 @@ class MobileNetV3Variant(MobileNetV3):
             feature_keys: An optional sequence of strings specifying the
                 selected feature names. This argument only takes effect if
                 `feature_extractor=True`. Defaults to `None`.
+            dtype: An optional `str` specifying the dtype policy used to build
+                the layers, such as `"bfloat16"` or `"float16"`, which map to
+                the corresponding mixed precision policies. The classifier is
+                kept in float32. If not specified, the global dtype policy
+                will be used. Defaults to `None`.
 
         Returns:
             A `keras.Model` instance.
@@ -389,7 +449,7 @@ class MobileNetV3Variant(MobileNetV3):
             kwargs["bn_epsilon"] = self.bn_epsilon
         if hasattr(self, "padding"):
             kwargs["padding"] = self.padding
-        if len(getattr(self, "available_weights", [])) == 0:
+        if weights is not None and len(self.available_weights) == 0:
             warnings.warn(
                 f"{self.__class__.__name__} doesn't have pretrained weights "
                 f"for '{weights}'."
@@ -412,16 +472,14 @@ class MobileNetV3Variant(MobileNetV3):
             name=name or str(self.__class__.__name__),
             feature_extractor=feature_extractor,
             feature_keys=feature_keys,
+            dtype=dtype,
             **kwargs,
         )
 
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W050Small(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [4, 8, 16, 16, 32, 32])],
-    ]
+    available_feature_keys = _SMALL_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -439,10 +497,7 @@ class MobileNetV3W050Small(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W075Small(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [4, 8, 16, 16, 32, 32])],
-    ]
+    available_feature_keys = _SMALL_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -460,10 +515,7 @@ class MobileNetV3W075Small(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W100Small(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [4, 8, 16, 16, 32, 32])],
-    ]
+    available_feature_keys = _SMALL_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -481,10 +533,7 @@ class MobileNetV3W100Small(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W100SmallMinimal(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [4, 8, 16, 16, 32, 32])],
-    ]
+    available_feature_keys = _SMALL_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -508,13 +557,7 @@ class MobileNetV3W100SmallMinimal(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W100Large(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[
-            f"BLOCK{i}_S{j}"
-            for i, j in zip(range(7), [2, 4, 8, 16, 16, 32, 32])
-        ],
-    ]
+    available_feature_keys = _LARGE_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -545,13 +588,7 @@ class MobileNetV3W100Large(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class MobileNetV3W100LargeMinimal(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[
-            f"BLOCK{i}_S{j}"
-            for i, j in zip(range(7), [2, 4, 8, 16, 16, 32, 32])
-        ],
-    ]
+    available_feature_keys = _LARGE_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -575,10 +612,7 @@ class MobileNetV3W100LargeMinimal(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class LCNet035(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [2, 4, 8, 16, 16, 32])],
-    ]
+    available_feature_keys = _LCNET_FEATURE_KEYS
     available_weights = []
 
     # Parameters
@@ -590,10 +624,7 @@ class LCNet035(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class LCNet050(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [2, 4, 8, 16, 16, 32])],
-    ]
+    available_feature_keys = _LCNET_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -611,10 +642,7 @@ class LCNet050(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class LCNet075(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [2, 4, 8, 16, 16, 32])],
-    ]
+    available_feature_keys = _LCNET_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -632,10 +660,7 @@ class LCNet075(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class LCNet100(MobileNetV3Variant):
-    available_feature_keys = [
-        "STEM_S2",
-        *[f"BLOCK{i}_S{j}" for i, j in zip(range(6), [2, 4, 8, 16, 16, 32])],
-    ]
+    available_feature_keys = _LCNET_FEATURE_KEYS
     available_weights = [
         (
             "imagenet",
@@ -653,13 +678,10 @@ class LCNet100(MobileNetV3Variant):
 
 @kimm_export(parent_path=["kimm.models", "kimm.models.mobilenet_v3"])
 class LCNet150(MobileNetV3):
-    available_feature_keys = [
-        "STEM_S2",
-        *[
-            f"BLOCK{i}_S{j}"
-            for i, j in zip(range(7), [2, 4, 8, 16, 16, 32, 32])
-        ],
-    ]
+    # LCNet150 subclasses MobileNetV3 rather than MobileNetV3Variant, so the
+    # parameters below are not forwarded and it builds the default "large"
+    # config. Its feature keys follow that config instead of the LCNet ones.
+    available_feature_keys = _LARGE_FEATURE_KEYS
     available_weights = []
 
     # Parameters
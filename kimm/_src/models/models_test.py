@@ -1,3 +1,5 @@
+import math
+
 import keras
 import pytest
 import tensorflow as tf
@@ -704,3 +706,72 @@ class ModelsTest(testing.TestCase, parameterized.TestCase):
         y2 = model2(x, training=False)
 
         self.assertAllClose(y1, y2)
+
+    def test_mobilenet_v3_dtype(self):
+        model_class = kimm_models.mobilenet_v3.MobileNetV3W050Small
+        original_dtype_policy = keras.config.dtype_policy().name
+
+        # Test mixed precision with a float32 classifier
+        model = model_class(weights=None, dtype="mixed_float16")
+        self.assertEqual(
+            model.get_layer("conv_stem_conv2d").compute_dtype, "float16"
+        )
+        self.assertEqual(
+            model.get_layer("conv_stem_conv2d").variable_dtype, "float32"
+        )
+        self.assertEqual(model.get_layer("classifier").compute_dtype, "float32")
+        self.assertEqual(model.output.dtype, "float32")
+        self.assertEqual(
+            keras.config.dtype_policy().name, original_dtype_policy
+        )
+
+        # Test get_config and from_config
+        config = model.get_config()
+        self.assertEqual(config["dtype"], "mixed_float16")
+        model = model_class.from_config(config)
+        self.assertEqual(model.build_dtype, "mixed_float16")
+        self.assertEqual(
+            model.get_layer("conv_stem_conv2d").compute_dtype, "float16"
+        )
+
+        # Test the global dtype policy is restored when the build raises
+        with self.assertRaises(ValueError):
+            model_class(weights=None, dtype="mixed_float16", padding="invalid")
+        self.assertEqual(
+            keras.config.dtype_policy().name, original_dtype_policy
+        )
+
+    @parameterized.named_parameters(
+        ("small_depth_2", "small", 2.0),
+        ("small_depth_0_5", "small", 0.5),
+        ("large_depth_2", "large", 2.0),
+        ("large_depth_0_5", "large", 0.5),
+    )
+    def test_mobilenet_v3_depth(self, config, depth):
+        mobilenet_v3 = kimm_models.mobilenet_v3
+        if config == "small":
+            stage_configs = mobilenet_v3.DEFAULT_SMALL_CONFIG
+        else:
+            stage_configs = mobilenet_v3.DEFAULT_LARGE_CONFIG
+        model = mobilenet_v3.MobileNetV3(
+            depth=depth, config=config, input_shape=(32, 32, 3), weights=None
+        )
+
+        block_names = set()
+        for layer in model.layers:
+            if layer.name.startswith("blocks_"):
+                block_names.add("_".join(layer.name.split("_")[:3]))
+        for stage_idx, stage_config in enumerate(stage_configs):
+            # No depth multiplier at the first and last stage
+            if 0 < stage_idx < len(stage_configs) - 1:
+                num_blocks = sum(
+                    math.ceil(c.repeat * depth) for c in stage_config
+                )
+            else:
+                num_blocks = sum(c.repeat for c in stage_config)
+            stage_block_names = [
+                name
+                for name in block_names
+                if name.startswith(f"blocks_{stage_idx}_")
+            ]
+            self.assertLen(stage_block_names, num_blocks)
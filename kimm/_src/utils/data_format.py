@@ -0,0 +1,13 @@
+import typing
+
+from keras import backend
+
+_CHANNELS_AXIS = {"channels_last": -1, "channels_first": -3}
+
+
+def get_channels_axis(data_format: typing.Optional[str] = None) -> int:
+    """Get the channels axis of 4D image tensors for `data_format`.
+
+    If `data_format` is `None`, `keras.backend.image_data_format()` is used.
+    """
+    return _CHANNELS_AXIS[data_format or backend.image_data_format()]
@@ -0,0 +1,29 @@
+import contextlib
+import typing
+
+from keras import config
+
+
+def get_dtype_policy(dtype: typing.Optional[str] = None):
+    """Map `"float16"` and `"bfloat16"` to the mixed precision policies.
+
+    The weights stay in float32 with the mixed precision policies, so
+    pretrained weights can be loaded without loss of precision.
+    """
+    if dtype in ("float16", "bfloat16"):
+        return f"mixed_{dtype}"
+    return dtype
+
+
+@contextlib.contextmanager
+def dtype_policy_scope(dtype: typing.Optional[str] = None):
+    """Temporarily set the global dtype policy if `dtype` is specified."""
+    if dtype is None:
+        yield
+        return
+    original_dtype_policy = config.dtype_policy()
+    config.set_dtype_policy(get_dtype_policy(dtype))
+    try:
+        yield
+    finally:
+        config.set_dtype_policy(original_dtype_policy)
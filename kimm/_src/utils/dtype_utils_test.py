@@ -0,0 +1,29 @@
+from keras import config
+from keras.src import testing
+
+from kimm._src.utils.dtype_utils import dtype_policy_scope
+from kimm._src.utils.dtype_utils import get_dtype_policy
+
+
+class DtypeUtilsTest(testing.TestCase):
+    def test_get_dtype_policy(self):
+        self.assertEqual(get_dtype_policy("float16"), "mixed_float16")
+        self.assertEqual(get_dtype_policy("bfloat16"), "mixed_bfloat16")
+        self.assertEqual(get_dtype_policy("float32"), "float32")
+        self.assertEqual(get_dtype_policy(None), None)
+
+    def test_dtype_policy_scope(self):
+        original_dtype_policy = config.dtype_policy().name
+
+        with dtype_policy_scope("bfloat16"):
+            self.assertEqual(config.dtype_policy().name, "mixed_bfloat16")
+        self.assertEqual(config.dtype_policy().name, original_dtype_policy)
+
+        with dtype_policy_scope(None):
+            self.assertEqual(config.dtype_policy().name, original_dtype_policy)
+
+        # Test restoring the policy when an error is raised
+        with self.assertRaises(RuntimeError):
+            with dtype_policy_scope("float16"):
+                raise RuntimeError()
+        self.assertEqual(config.dtype_policy().name, original_dtype_policy)
@@ -1,3 +1,4 @@
+import functools
 import typing
 
 
@@ -7,9 +8,22 @@ def make_divisible(
     min_value: typing.Optional[float] = None,
     round_limit: float = 0.9,
 ):
+    try:
+        return _cached_make_divisible(v, divisor, min_value, round_limit)
+    except TypeError:
+        # Unhashable arguments such as numpy arrays
+        return _make_divisible(v, divisor, min_value, round_limit)
+
+
+def _make_divisible(v, divisor, min_value, round_limit):
     min_value = min_value or divisor
     new_v = max(min_value, int(v + divisor / 2) // divisor * divisor)
     # Make sure that round down does not go down by more than 10%.
     if new_v < round_limit * v:
         new_v += divisor
     return new_v
+
+
+_cached_make_divisible = functools.lru_cache(maxsize=None, typed=True)(
+    _make_divisible
+)
@@ -0,0 +1,26 @@
+import numpy as np
+from keras.src import testing
+
+from kimm._src.utils.make_divisble import make_divisible
+
+
+class MakeDivisibleTest(testing.TestCase):
+    def test_make_divisible(self):
+        self.assertEqual(make_divisible(16), 16)
+        self.assertEqual(make_divisible(37.5), 40)
+        self.assertEqual(make_divisible(5.6), 8)
+        # Round up if rounding down loses more than 10%
+        self.assertEqual(make_divisible(10), 16)
+
+    def test_make_divisible_numpy(self):
+        self.assertEqual(make_divisible(np.float32(37.5)), 40)
+        # Unhashable arguments bypass the cache
+        self.assertEqual(make_divisible(np.array(37.5)), 40)
+
+    def test_make_divisible_keeps_divisor_type(self):
+        result = make_divisible(20, 8)
+        self.assertIsInstance(result, int)
+        # The cache must not return the int result for a float divisor
+        result = make_divisible(20, 8.0)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, 24.0)
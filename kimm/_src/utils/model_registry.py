@@ -1,37 +1,34 @@
+import bisect
 import sys
 import typing
 import warnings
 
 from kimm._src.kimm_export import kimm_export
 
-# {
+# name: {
 #     "name",  # str
 #     "feature_extractor",  # bool
 #     "feature_keys",  # list of str
 #     "weights",  # None or str
 # }
-MODEL_REGISTRY: typing.List[typing.Dict[str, typing.Union[str, bool]]] = []
+MODEL_REGISTRY: typing.Dict[str, typing.Dict[str, typing.Union[str, bool]]] = {}
+# Sorted names of `MODEL_REGISTRY` for `list_models` without filters
+_SORTED_NAMES: typing.List[str] = []
+
+# Characters to ignore in the query of `list_models`
+_QUERY_TRANS = str.maketrans("", "", " _.")
 
 
 def _match_string(query: str, target: str):
-    query = query.lower().replace(" ", "").replace("_", "").replace(".", "")
-    target = target.lower()
-    matched_idx = -1
-    for q_char in query:
-        matched = False
-        for idx, t_char in enumerate(target):
-            if matched:
-                break
-            if q_char == t_char and idx > matched_idx:
-                matched_idx = idx
-                matched = True
-        if not matched:
-            return False
-    return True
+    # `query` must be a subsequence of `target`
+    query = query.lower().translate(_QUERY_TRANS)
+    target = iter(target.lower())
+    return all(q_char in target for q_char in query)
 
 
 def clear_registry():
     MODEL_REGISTRY.clear()
+    _SORTED_NAMES.clear()
 
 
 def add_model_to_registry(model_cls, weights: typing.Optional[str] = None):
@@ -51,11 +48,10 @@ def add_model_to_registry(model_cls, weights: typing.Optional[str] = None):
     if issubclass(model_cls, BaseModel):
         feature_extractor = True
         feature_keys = model_cls.available_feature_keys
-    for info in MODEL_REGISTRY:
-        if info["name"] == model_cls.__name__:
-            warnings.warn(
-                f"MODEL_REGISTRY already contains name={model_cls.__name__}!"
-            )
+    if model_name in MODEL_REGISTRY:
+        warnings.warn(f"MODEL_REGISTRY already contains name={model_name}!")
+    else:
+        bisect.insort(_SORTED_NAMES, model_name)
     if weights is not None:
         if not isinstance(weights, str):
             raise ValueError(
@@ -63,14 +59,12 @@ def add_model_to_registry(model_cls, weights: typing.Optional[str] = None):
                 f"Recieved: weight={weights}"
             )
         weights = weights.lower()
-    MODEL_REGISTRY.append(
-        {
-            "name": model_cls.__name__,
-            "feature_extractor": feature_extractor,
-            "feature_keys": feature_keys,
-            "weights": weights,
-        }
-    )
+    MODEL_REGISTRY[model_name] = {
+        "name": model_name,
+        "feature_extractor": feature_extractor,
+        "feature_keys": feature_keys,
+        "weights": weights,
+    }
 
 
 @kimm_export(parent_path=["kimm", "kimm.utils"])
@@ -94,30 +88,28 @@ def list_models(
     Returns:
         A list of model names.
     """
-    result_names: typing.Set[str] = set()
-    for info in MODEL_REGISTRY:
-        # Add by default
-        result_names.add(info["name"])
-        need_remove = False
+    if name is None and feature_extractor is None and weights is None:
+        return list(_SORTED_NAMES)
 
+    result_names: typing.List[str] = []
+    for info in MODEL_REGISTRY.values():
         # Match string (simple implementation)
-        if name is not None:
-            need_remove = not _match_string(name, info["name"])
+        if name is not None and not _match_string(name, info["name"]):
+            continue
 
         # Filter by feature_extractor and weights
         if (
             feature_extractor is not None
             and info["feature_extractor"] is not feature_extractor
         ):
-            need_remove = True
+            continue
         if weights is not None and info["weights"] != weights:
             if weights is True and info["weights"] is None:
-                need_remove = True
+                continue
             elif weights is False and info["weights"] is not None:
-                need_remove = True
+                continue
             elif isinstance(weights, str):
                 if weights.lower() != info["weights"]:
-                    need_remove = True
-        if need_remove:
-            result_names.remove(info["name"])
+                    continue
+        result_names.append(info["name"])
     return sorted(result_names)
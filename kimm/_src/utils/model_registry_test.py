@@ -23,25 +23,26 @@ class ModelRegistryTest(testing.TestCase):
 
         add_model_to_registry(DummyModel, None)
         self.assertEqual(len(MODEL_REGISTRY), 1)
-        self.assertEqual(MODEL_REGISTRY[0]["name"], DummyModel.__name__)
-        self.assertEqual(MODEL_REGISTRY[0]["feature_extractor"], False)
-        self.assertEqual(MODEL_REGISTRY[0]["feature_keys"], [])
-        self.assertEqual(MODEL_REGISTRY[0]["weights"], None)
+        info = MODEL_REGISTRY[DummyModel.__name__]
+        self.assertEqual(info["name"], DummyModel.__name__)
+        self.assertEqual(info["feature_extractor"], False)
+        self.assertEqual(info["feature_keys"], [])
+        self.assertEqual(info["weights"], None)
 
         add_model_to_registry(DummyFeatureExtractor, "imagenet")
         self.assertEqual(len(MODEL_REGISTRY), 2)
-        self.assertEqual(
-            MODEL_REGISTRY[1]["name"], DummyFeatureExtractor.__name__
-        )
-        self.assertEqual(MODEL_REGISTRY[1]["feature_extractor"], True)
-        self.assertEqual(MODEL_REGISTRY[1]["feature_keys"], ["A", "B", "C"])
-        self.assertEqual(MODEL_REGISTRY[1]["weights"], "imagenet")
+        info = MODEL_REGISTRY[DummyFeatureExtractor.__name__]
+        self.assertEqual(info["name"], DummyFeatureExtractor.__name__)
+        self.assertEqual(info["feature_extractor"], True)
+        self.assertEqual(info["feature_keys"], ["A", "B", "C"])
+        self.assertEqual(info["weights"], "imagenet")
 
     def test_add_model_to_registry_invalid(self):
         clear_registry()
         add_model_to_registry(DummyModel, None)
         with self.assertWarnsRegex(Warning, "MODEL_REGISTRY already contains"):
             add_model_to_registry(DummyModel, None)
+        self.assertEqual(list_models(), [DummyModel.__name__])
 
     def test_list_models(self):
         clear_registry()
@@ -115,10 +115,18 @@ def assign_weights(
         ):
             try:
                 # conventional conv2d layer
-                keras_weight.assign(np.transpose(torch_weight, [2, 3, 1, 0]))
+                keras_weight.assign(
+                    np.ascontiguousarray(
+                        np.transpose(torch_weight, [2, 3, 1, 0])
+                    )
+                )
             except ValueError:
                 # depthwise conv2d layer
-                keras_weight.assign(np.transpose(torch_weight, [2, 3, 0, 1]))
+                keras_weight.assign(
+                    np.ascontiguousarray(
+                        np.transpose(torch_weight, [2, 3, 0, 1])
+                    )
+                )
         else:
             raise ValueError(
                 f"Failed to assign {keras_name}. "
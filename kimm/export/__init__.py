@@ -6,3 +6,4 @@ since your modifications would be overwritten.
 
 from kimm._src.export.export_onnx import export_onnx
 from kimm._src.export.export_tflite import export_tflite
+from kimm._src.export.fold_bn import fold_batchnorm
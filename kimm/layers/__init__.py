@@ -5,6 +5,7 @@ since your modifications would be overwritten.
 """
 
 from kimm._src.layers.attention import Attention
+from kimm._src.layers.gelu_dropout import GeluDropout
 from kimm._src.layers.layer_scale import LayerScale
 from kimm._src.layers.learnable_affine import LearnableAffine
 from kimm._src.layers.position_embedding import PositionEmbedding
@@ -3,13 +3,18 @@ pip install torch torchvision --index-url https://download.pytorch.org/whl/cpu
 pip install timm
 """
 
+import concurrent.futures
+import functools
+import gc
 import os
+import re
 
 import keras
 import numpy as np
 import timm
 import torch
 
+from kimm.export import export_tflite
 from kimm.models import mobilenet_v3
 from kimm.timm_utils import assign_weights
 from kimm.timm_utils import is_same_weights
@@ -39,14 +44,88 @@ keras_model_classes = [
     mobilenet_v3.LCNet100,
 ]
 
-for timm_model_name, keras_model_class in zip(
-    timm_model_names, keras_model_classes
+common_mapping = {
+    # stem
+    "conv.stem.conv2d": "conv_stem",
+    "conv.stem.bn": "bn1",
+    # se
+    "se.conv.reduce": "se.conv_reduce",
+    "se.conv.expand": "se.conv_expand",
+    # conv head
+    "conv.head": "conv_head",
+    # weights naming mapping
+    "kernel": "weight",  # conv2d
+    "gamma": "weight",  # bn
+    "beta": "bias",  # bn
+    "moving.mean": "running_mean",  # bn
+    "moving.variance": "running_var",  # bn
+}
+ds_mapping = {
+    **common_mapping,
+    # depthwise separation block
+    "conv.dw.dwconv2d": "conv_dw",
+    "conv.dw.bn": "bn1",
+    "conv.pw.conv2d": "conv_pw",
+    "conv.pw.bn": "bn2",
+}
+ir_mapping = {
+    **common_mapping,
+    # inverted residual block
+    "conv.pw.conv2d": "conv_pw",
+    "conv.pw.bn": "bn1",
+    "conv.dw.dwconv2d": "conv_dw",
+    "conv.dw.bn": "bn2",
+    "conv.pwl.conv2d": "conv_pwl",
+    "conv.pwl.bn": "bn3",
+}
+# Rename in a single pass
+ds_pattern = re.compile("|".join(map(re.escape, ds_mapping)))
+ir_pattern = re.compile("|".join(map(re.escape, ir_mapping)))
+
+
+@functools.lru_cache(maxsize=None)
+def keras_to_torch_name(keras_name: str, keras_model_class_name: str):
+    torch_name = keras_name.replace("_", ".")
+    if "LCNet" in keras_model_class_name or "blocks.0.0" in torch_name:
+        # depthwise separation block
+        torch_name = ds_pattern.sub(
+            lambda m: ds_mapping[m.group(0)], torch_name
+        )
+    else:
+        # inverted residual block
+        torch_name = ir_pattern.sub(
+            lambda m: ir_mapping[m.group(0)], torch_name
+        )
+    # last conv block
+    if "Small" in keras_model_class_name:
+        if "blocks.5.0" in torch_name:
+            torch_name = torch_name.replace("conv2d", "conv")
+            torch_name = torch_name.replace("bn", "bn1")
+    if "Large" in keras_model_class_name:
+        if "blocks.6.0" in torch_name:
+            torch_name = torch_name.replace("conv2d", "conv")
+            torch_name = torch_name.replace("bn", "bn1")
+    return torch_name
+
+
+# Download the next timm model in the background while converting
+executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+torch_model_future = executor.submit(
+    timm.create_model, timm_model_names[0], pretrained=True
+)
+
+for i, (timm_model_name, keras_model_class) in enumerate(
+    zip(timm_model_names, keras_model_classes)
 ):
     """
     Prepare timm model and keras model
     """
     input_shape = [224, 224, 3]
-    torch_model = timm.create_model(timm_model_name, pretrained=True)
+    torch_model = torch_model_future.result()
+    if i + 1 < len(timm_model_names):
+        torch_model_future = executor.submit(
+            timm.create_model, timm_model_names[i + 1], pretrained=True
+        )
     torch_model = torch_model.eval()
     trainable_state_dict, non_trainable_state_dict = separate_torch_state_dict(
         torch_model.state_dict()
@@ -60,6 +139,7 @@ for timm_model_name, keras_model_class in zip(
     trainable_weights, non_trainable_weights = separate_keras_weights(
         keras_model
     )
+    torch_state_dict = {**trainable_state_dict, **non_trainable_state_dict}
 
     # for torch_name, (_, keras_name) in zip(
     #     trainable_state_dict.keys(), trainable_weights
@@ -76,65 +156,16 @@ for timm_model_name, keras_model_class in zip(
     """
     for keras_weight, keras_name in trainable_weights + non_trainable_weights:
         keras_name: str
-        torch_name = keras_name
-        torch_name = torch_name.replace("_", ".")
-        # stem
-        torch_name = torch_name.replace("conv.stem.conv2d", "conv_stem")
-        torch_name = torch_name.replace("conv.stem.bn", "bn1")
-        # LCNet
-        if "LCNet" in keras_model_class.__name__:
-            # depthwise separation block
-            torch_name = torch_name.replace("conv.dw.dwconv2d", "conv_dw")
-            torch_name = torch_name.replace("conv.dw.bn", "bn1")
-            torch_name = torch_name.replace("conv.pw.conv2d", "conv_pw")
-            torch_name = torch_name.replace("conv.pw.bn", "bn2")
-        # blocks
-        if "blocks.0.0" in torch_name:
-            # depthwise separation block
-            torch_name = torch_name.replace("conv.dw.dwconv2d", "conv_dw")
-            torch_name = torch_name.replace("conv.dw.bn", "bn1")
-            torch_name = torch_name.replace("conv.pw.conv2d", "conv_pw")
-            torch_name = torch_name.replace("conv.pw.bn", "bn2")
-        else:
-            # inverted residual block
-            torch_name = torch_name.replace("conv.pw.conv2d", "conv_pw")
-            torch_name = torch_name.replace("conv.pw.bn", "bn1")
-            torch_name = torch_name.replace("conv.dw.dwconv2d", "conv_dw")
-            torch_name = torch_name.replace("conv.dw.bn", "bn2")
-            torch_name = torch_name.replace("conv.pwl.conv2d", "conv_pwl")
-            torch_name = torch_name.replace("conv.pwl.bn", "bn3")
-        # se
-        torch_name = torch_name.replace("se.conv.reduce", "se.conv_reduce")
-        torch_name = torch_name.replace("se.conv.expand", "se.conv_expand")
-        # last conv block
-        if "Small" in keras_model_class.__name__:
-            if "blocks.5.0" in torch_name:
-                torch_name = torch_name.replace("conv2d", "conv")
-                torch_name = torch_name.replace("bn", "bn1")
-        if "Large" in keras_model_class.__name__:
-            if "blocks.6.0" in torch_name:
-                torch_name = torch_name.replace("conv2d", "conv")
-                torch_name = torch_name.replace("bn", "bn1")
-        # conv head
-        torch_name = torch_name.replace("conv.head", "conv_head")
-
-        # weights naming mapping
-        torch_name = torch_name.replace("kernel", "weight")  # conv2d
-        torch_name = torch_name.replace("gamma", "weight")  # bn
-        torch_name = torch_name.replace("beta", "bias")  # bn
-        torch_name = torch_name.replace("moving.mean", "running_mean")  # bn
-        torch_name = torch_name.replace("moving.variance", "running_var")  # bn
+        torch_name = keras_to_torch_name(keras_name, keras_model_class.__name__)
 
         # assign weights
-        if torch_name in trainable_state_dict:
-            torch_weights = trainable_state_dict[torch_name].numpy()
-        elif torch_name in non_trainable_state_dict:
-            torch_weights = non_trainable_state_dict[torch_name].numpy()
-        else:
+        torch_weights = torch_state_dict.get(torch_name)
+        if torch_weights is None:
             raise ValueError(
                 "Can't find the corresponding torch weights. "
                 f"Got keras_name={keras_name}, torch_name={torch_name}"
             )
+        torch_weights = torch_weights.numpy()
         if is_same_weights(keras_name, keras_weight, torch_name, torch_weights):
             assign_weights(keras_name, keras_weight, torch_weights)
         else:
@@ -150,9 +181,10 @@ for timm_model_name, keras_model_class in zip(
     Verify model outputs
     """
     np.random.seed(2023)
-    keras_data = np.random.uniform(size=[1] + input_shape).astype("float32")
+    keras_data = np.random.uniform(size=[8] + input_shape).astype("float32")
     torch_data = torch.from_numpy(np.transpose(keras_data, [0, 3, 1, 2]))
-    torch_y = torch_model(torch_data)
+    with torch.inference_mode():
+        torch_y = torch_model(torch_data)
     keras_y = keras_model(keras_data, training=False)
     torch_y = torch_y.detach().cpu().numpy()
     keras_y = keras.ops.convert_to_numpy(keras_y)
@@ -166,3 +198,85 @@ for timm_model_name, keras_model_class in zip(
     export_path = f"exported/{keras_model.name.lower()}_{timm_model_name}.keras"
     keras_model.save(export_path)
     print(f"Export to {export_path}")
+
+    """
+    Export int8 tflite model (requires tensorflow backend)
+    """
+    if keras.backend.backend() == "tensorflow":
+        import tensorflow as tf
+
+        # Quantize a model with the preprocessing included so that the int8
+        # input quantization is calibrated on raw [0, 255] images
+        tflite_keras_model = keras_model_class(
+            input_shape=input_shape,
+            include_preprocessing=True,
+            classifier_activation="linear",
+            weights=None,
+        )
+        tflite_keras_model.set_weights(keras_model.get_weights())
+
+        def representative_dataset():
+            for _ in range(100):
+                yield [
+                    np.random.uniform(0, 255, size=[1] + input_shape).astype(
+                        "float32"
+                    )
+                ]
+
+        tflite_export_path = export_path.replace(".keras", "_int8.tflite")
+        temp_tflite_export_path = f"{tflite_export_path}.tmp"
+        export_tflite(
+            tflite_keras_model,
+            input_shape,
+            temp_tflite_export_path,
+            "int8",
+            representative_dataset,
+        )
+
+        # Verify top-1 agreement with the float model before saving
+        interpreter = tf.lite.Interpreter(model_path=temp_tflite_export_path)
+        interpreter.allocate_tensors()
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        input_scale, input_zero_point = input_details["quantization"]
+        output_scale, output_zero_point = output_details["quantization"]
+        images = np.random.uniform(0, 255, size=[32] + input_shape).astype(
+            "float32"
+        )
+        tflite_y = []
+        for image in images:
+            x = np.round(image[None] / input_scale + input_zero_point)
+            x = np.clip(x, -128, 127).astype("int8")
+            interpreter.set_tensor(input_details["index"], x)
+            interpreter.invoke()
+            y = interpreter.get_tensor(output_details["index"])
+            tflite_y.append(
+                (y.astype("float32") - output_zero_point) * output_scale
+            )
+        tflite_y = np.concatenate(tflite_y, axis=0)
+        float_y = tflite_keras_model.predict(images, verbose=0)
+        agreement = np.mean(
+            np.argmax(tflite_y, axis=-1) == np.argmax(float_y, axis=-1)
+        )
+        if agreement < 0.9:
+            os.remove(temp_tflite_export_path)
+            raise ValueError(
+                "The int8 tflite model doesn't match the float model. "
+                f"Got top-1 agreement={agreement:.2f}"
+            )
+        os.replace(temp_tflite_export_path, tflite_export_path)
+        print(
+            f"Export to {tflite_export_path} (top-1 agreement={agreement:.2f})"
+        )
+        del tflite_keras_model, interpreter
+
+    """
+    Free the models before converting the next one
+    """
+    del torch_model, keras_model
+    del torch_state_dict, trainable_state_dict, non_trainable_state_dict
+    del trainable_weights, non_trainable_weights
+    keras.backend.clear_session()
+    gc.collect()
+
+executor.shutdown()
@@ -3,7 +3,12 @@ pip install torch torchvision --index-url https://download.pytorch.org/whl/cpu
 pip install timm
 """
 
+import concurrent.futures
+import functools
+import gc
+import itertools
 import os
+import re
 
 import keras
 import numpy as np
@@ -14,7 +19,6 @@ from kimm.models import regnet
 from kimm.timm_utils import assign_weights
 from kimm.timm_utils import is_same_weights
 from kimm.timm_utils import separate_keras_weights
-from kimm.timm_utils import separate_torch_state_dict
 
 timm_model_names = [
     "regnetx_002.pycls_in1k",
@@ -69,18 +73,90 @@ keras_model_classes = [
     regnet.RegNetY320,
 ]
 
-for timm_model_name, keras_model_class in zip(
-    timm_model_names, keras_model_classes
+name_mapping = {
+    # stem and blocks
+    "conv2d": "conv",
+    # se
+    "se.conv.reduce": "se.fc1",
+    "se.conv.expand": "se.fc2",
+    # head
+    "classifier": "head.fc",
+    # weights naming mapping
+    "kernel": "weight",  # conv2d
+    "gamma": "weight",  # bn
+    "beta": "bias",  # bn
+    "moving.mean": "running_mean",  # bn
+    "moving.variance": "running_var",  # bn
+}
+# Rename in a single pass, preferring the longest match
+name_pattern = re.compile(
+    "|".join(map(re.escape, sorted(name_mapping, key=len, reverse=True)))
+)
+
+
+@functools.lru_cache(maxsize=None)
+def keras_to_torch_name(keras_name: str):
+    torch_name = keras_name.replace("_", ".")
+    return name_pattern.sub(lambda m: name_mapping[m.group(0)], torch_name)
+
+
+def get_export_path(timm_model_name, keras_model_class):
+    return (
+        f"exported/{keras_model_class.__name__.lower()}_{timm_model_name}.keras"
+    )
+
+
+# Skip the exported models unless FORCE_RECONVERT is set
+if not os.environ.get("FORCE_RECONVERT"):
+    pending_names, pending_classes = [], []
+    for timm_model_name, keras_model_class in zip(
+        timm_model_names, keras_model_classes
+    ):
+        export_path = get_export_path(timm_model_name, keras_model_class)
+        if os.path.exists(export_path):
+            print(f"Skip {export_path}")
+            continue
+        pending_names.append(timm_model_name)
+        pending_classes.append(keras_model_class)
+    timm_model_names, keras_model_classes = pending_names, pending_classes
+
+# Use all cores for the single-batch verification forward pass
+torch.set_num_threads(os.cpu_count())
+
+# Prepare the verification inputs once, with a C-contiguous NCHW copy
+input_shape = [224, 224, 3]
+np.random.seed(2023)
+keras_data = np.random.uniform(size=[1] + input_shape).astype("float32")
+torch_data = torch.from_numpy(
+    np.ascontiguousarray(np.transpose(keras_data, [0, 3, 1, 2]))
+)
+
+# Download the next timm model in the background while converting
+executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+if timm_model_names:
+    torch_model_future = executor.submit(
+        timm.create_model, timm_model_names[0], pretrained=True
+    )
+
+for i, (timm_model_name, keras_model_class) in enumerate(
+    zip(timm_model_names, keras_model_classes)
 ):
     """
     Prepare timm model and keras model
     """
-    input_shape = [224, 224, 3]
-    torch_model = timm.create_model(timm_model_name, pretrained=True)
+    torch_model = torch_model_future.result()
+    if i + 1 < len(timm_model_names):
+        torch_model_future = executor.submit(
+            timm.create_model, timm_model_names[i + 1], pretrained=True
+        )
     torch_model = torch_model.eval()
-    trainable_state_dict, non_trainable_state_dict = separate_torch_state_dict(
-        torch_model.state_dict()
-    )
+    # Read the parameters and buffers directly instead of via state_dict()
+    trainable_state_dict = dict(torch_model.named_parameters())
+    non_trainable_state_dict = {
+        k: v
+        for k, v in torch_model.named_buffers()
+        if "num_batches_tracked" not in k
+    }
     keras_model = keras_model_class(
         input_shape=input_shape,
         include_preprocessing=False,
@@ -90,6 +166,13 @@ for timm_model_name, keras_model_class in zip(
     trainable_weights, non_trainable_weights = separate_keras_weights(
         keras_model
     )
+    # Convert all torch tensors to numpy in one pass
+    torch_state_dict = {
+        k: v.detach().numpy()
+        for k, v in itertools.chain(
+            trainable_state_dict.items(), non_trainable_state_dict.items()
+        )
+    }
 
     # for torch_name, (_, keras_name) in zip(
     #     trainable_state_dict.keys(), trainable_weights
@@ -105,38 +188,28 @@ for timm_model_name, keras_model_class in zip(
     """
     Assign weights
     """
-    for keras_weight, keras_name in trainable_weights + non_trainable_weights:
+    for keras_weight, keras_name in itertools.chain(
+        trainable_weights, non_trainable_weights
+    ):
         keras_name: str
-        torch_name = keras_name
-        torch_name = torch_name.replace("_", ".")
-        # stem
-        torch_name = torch_name.replace("stem_conv2d", "stem.conv")
-        # blocks
-        torch_name = torch_name.replace("conv2d", "conv")
-        # se
-        torch_name = torch_name.replace("se.conv.reduce", "se.fc1")
-        torch_name = torch_name.replace("se.conv.expand", "se.fc2")
-        # head
-        torch_name = torch_name.replace("classifier", "head.fc")
-
-        # weights naming mapping
-        torch_name = torch_name.replace("kernel", "weight")  # conv2d
-        torch_name = torch_name.replace("gamma", "weight")  # bn
-        torch_name = torch_name.replace("beta", "bias")  # bn
-        torch_name = torch_name.replace("moving.mean", "running_mean")  # bn
-        torch_name = torch_name.replace("moving.variance", "running_var")  # bn
+        torch_name = keras_to_torch_name(keras_name)
 
         # assign weights
-        if torch_name in trainable_state_dict:
-            torch_weights = trainable_state_dict[torch_name].numpy()
-        elif torch_name in non_trainable_state_dict:
-            torch_weights = non_trainable_state_dict[torch_name].numpy()
-        else:
+        # Pop the consumed weights
+        torch_weights = torch_state_dict.pop(torch_name, None)
+        if torch_weights is None:
             raise ValueError(
                 "Can't find the corresponding torch weights. "
                 f"Got keras_name={keras_name}, torch_name={torch_name}"
             )
-        if is_same_weights(keras_name, keras_weight, torch_name, torch_weights):
+        # Compare the transposed torch shape directly before falling back
+        if torch_weights.ndim == 4:
+            expected_shape = tuple(torch_weights.shape[i] for i in (2, 3, 1, 0))
+        else:
+            expected_shape = torch_weights.shape[::-1]
+        if tuple(keras_weight.shape) == expected_shape or is_same_weights(
+            keras_name, keras_weight, torch_name, torch_weights
+        ):
             assign_weights(keras_name, keras_weight, torch_weights)
         else:
             raise ValueError(
@@ -150,10 +223,8 @@ for timm_model_name, keras_model_class in zip(
     """
     Verify model outputs
     """
-    np.random.seed(2023)
-    keras_data = np.random.uniform(size=[1] + input_shape).astype("float32")
-    torch_data = torch.from_numpy(np.transpose(keras_data, [0, 3, 1, 2]))
-    torch_y = torch_model(torch_data)
+    with torch.inference_mode():
+        torch_y = torch_model(torch_data)
     keras_y = keras_model(keras_data, training=False)
     torch_y = torch_y.detach().cpu().numpy()
     keras_y = keras.ops.convert_to_numpy(keras_y)
@@ -168,6 +239,17 @@ for timm_model_name, keras_model_class in zip(
     Save converted model
     """
     os.makedirs("exported", exist_ok=True)
-    export_path = f"exported/{keras_model.name.lower()}_{timm_model_name}.keras"
+    export_path = get_export_path(timm_model_name, keras_model_class)
     keras_model.save(export_path)
     print(f"Export to {export_path}")
+
+    """
+    Free the models before converting the next one
+    """
+    del torch_model, keras_model
+    del torch_state_dict, trainable_state_dict, non_trainable_state_dict
+    del trainable_weights, non_trainable_weights
+    keras.backend.clear_session()
+    gc.collect()
+
+executor.shutdown()